@@ -133,6 +133,14 @@ TEMPLATES = [
     },
 ]
 
+# Tests: Django already wraps the filesystem/app_directories loaders in the
+# cached loader (also with DEBUG on), so each template compiles once per
+# process. Additionally turn off template debug info under tests - DEBUG is
+# forced on above, which would otherwise make every template compile through
+# the slower DebugLexer that records source positions for error pages.
+if 'pytest' in sys.modules or 'test' in sys.argv:
+    TEMPLATES[0]['OPTIONS']['debug'] = False
+
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
@@ -182,6 +190,34 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Tests: Use a fast hasher. PBKDF2's iteration count makes every
+# create_user()/login() in the suite CPU-bound; test passwords need no strength.
+if 'pytest' in sys.modules or 'test' in sys.argv:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+
+class DisableMigrations(dict):
+    """MIGRATION_MODULES mapping that reports every app as having no migrations."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+# Opt-in: build the test database straight from the models instead of replaying
+# every migration. Seeded data (skill categories, global lessons) comes from data
+# migrations, so tests relying on it fail in this mode - use it for fast local
+# runs of suites like test_admin, e.g.:
+#   TEST_DISABLE_MIGRATIONS=1 pytest home/tests/test_admin.py
+# Accepts the same truthy values as IS_DEVEDU.
+if (('pytest' in sys.modules or 'test' in sys.argv)
+        and os.environ.get('TEST_DISABLE_MIGRATIONS', '').strip().lower() in ('true', '1', 'yes')):
+    MIGRATION_MODULES = DisableMigrations()
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -190,3 +190,35 @@ class TestPasswordValidators(TestCase):
         )
         self.assertIsNotNone(min_length_validator)
         self.assertEqual(min_length_validator['OPTIONS']['min_length'], 8)
+
+    def test_fast_password_hasher_in_tests(self):
+        """Test the suite hashes passwords with the fast MD5 hasher"""
+        self.assertEqual(
+            settings.PASSWORD_HASHERS,
+            ['django.contrib.auth.hashers.MD5PasswordHasher']
+        )
+
+
+class TestDisableMigrations(TestCase):
+    """Test the opt-in MIGRATION_MODULES mapping used for fast test runs."""
+
+    def test_disable_migrations_maps_every_app_to_none(self):
+        """Test DisableMigrations reports no migrations module for any app"""
+        from config.settings import DisableMigrations
+
+        modules = DisableMigrations()
+        self.assertIn('home', modules)
+        self.assertIsNone(modules['home'])
+        self.assertIsNone(modules['auth'])
+
+
+class TestTemplateSettings(TestCase):
+    """Test template engine configuration used by the test suite."""
+
+    def test_templates_use_cached_loader_without_debug(self):
+        """Test templates compile once per process and skip debug info in tests"""
+        from django.template import engines
+
+        engine = engines['django'].engine
+        self.assertFalse(engine.debug)
+        self.assertEqual(engine.loaders[0][0], 'django.template.loaders.cached.Loader')
@@ -9,3 +9,24 @@ def django_test_settings():
     # Disable APPEND_SLASH to avoid 301 redirects in tests
     settings.APPEND_SLASH = False
 
+
+
+@pytest.fixture(scope='module')
+def shared_admin_user(django_db_setup, django_db_blocker):  # pylint: disable=unused-argument
+    """
+    One superuser shared by all admin test classes in a module.
+
+    Created outside the per-class transactions so every class's
+    setUpTestData can reuse it via test_utils.get_shared_superuser(), and
+    deleted when the module finishes. Request it with
+    ``pytestmark = pytest.mark.usefixtures('shared_admin_user')``.
+    """
+    from home.tests.test_utils import SHARED_ADMIN, create_test_superuser
+
+    with django_db_blocker.unblock():
+        user = create_test_superuser()
+    SHARED_ADMIN['user'] = user
+    yield user
+    SHARED_ADMIN.pop('user', None)
+    with django_db_blocker.unblock():
+        user.delete()
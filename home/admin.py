@@ -279,6 +279,7 @@ reset_progress_stats.short_description = "Reset progress statistics"
 class UserProgressAdmin(admin.ModelAdmin):
     """Admin interface for UserProgress model with progress statistics."""
     list_display = ('user', 'total_minutes_studied', 'total_lessons_completed', 'total_quizzes_taken', 'overall_quiz_accuracy', 'updated_at')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'user__email')
     list_filter = ('created_at', 'updated_at')
     readonly_fields = ('created_at', 'updated_at')
@@ -311,6 +312,7 @@ delete_selected_lessons.short_description = "Delete selected lesson completions"
 class LessonCompletionAdmin(admin.ModelAdmin):
     """Admin interface for LessonCompletion tracking."""
     list_display = ('user', 'lesson_title', 'lesson_id', 'duration_minutes', 'completed_at')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'lesson_title', 'lesson_id')
     list_filter = ('completed_at',)
     readonly_fields = ('completed_at',)
@@ -330,6 +332,7 @@ delete_selected_quizzes.short_description = "Delete selected quiz results"
 class QuizResultAdmin(admin.ModelAdmin):
     """Admin interface for QuizResult tracking with scoring statistics."""
     list_display = ('user', 'quiz_title', 'quiz_id', 'score', 'total_questions', 'accuracy_percentage', 'completed_at')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'quiz_title', 'quiz_id')
     list_filter = ('completed_at',)
     readonly_fields = ('completed_at',)
@@ -2,6 +2,7 @@
 Django management command to create the Colors lesson with flashcards and quiz questions.
 """
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from home.models import Flashcard, Lesson, LessonQuizQuestion
 
@@ -10,8 +11,14 @@ class Command(BaseCommand):
     """Creates the Colors lesson with flashcards and quiz questions."""
     help = 'Creates the Colors lesson with flashcards and quiz'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
-        """Create Colors lesson with flashcards and quiz questions."""
+        """
+        Create Colors lesson with flashcards and quiz questions.
+
+        Runs in one transaction so a re-run never leaves the lesson with its
+        cards cleared but not recreated, and the writes commit together.
+        """
         # Create or get the lesson
         lesson, created = Lesson.objects.get_or_create(
             title='Colors in Spanish',
@@ -0,0 +1,64 @@
+# Trigram indexes backing the admin changelist searches (PostgreSQL only)
+
+from django.db import migrations
+
+# (index name, table, column) for every column the admin searches with icontains.
+# user__username lookups on the progress/completion/quiz admins hit auth_user too.
+TRIGRAM_INDEXES = [
+    ('auth_user_username_trgm', 'auth_user', 'username'),
+    ('auth_user_email_trgm', 'auth_user', 'email'),
+    ('home_lessoncompletion_title_trgm', 'home_lessoncompletion', 'lesson_title'),
+    ('home_lessoncompletion_lesson_id_trgm', 'home_lessoncompletion', 'lesson_id'),
+    ('home_quizresult_title_trgm', 'home_quizresult', 'quiz_title'),
+    ('home_quizresult_quiz_id_trgm', 'home_quizresult', 'quiz_id'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Enable pg_trgm and add GIN trigram indexes for admin search columns.
+
+    Django admin search uses icontains, which PostgreSQL renders as
+    ``UPPER("col"::text) LIKE UPPER('%term%')``. A btree index cannot serve
+    that, so the query falls back to a sequential scan. The GIN indexes are
+    built on the same ``UPPER(col::text)`` expression with the gin_trgm_ops
+    operator class so the planner can match them to the admin query.
+
+    SQLite (tests/local development) has no equivalent, so this is a no-op
+    there. Indexes are built CONCURRENTLY so production writes are not
+    blocked, which is why the migration is non-atomic.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for index_name, table, column in TRIGRAM_INDEXES:
+            cursor.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} '
+                f'ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for index_name, _table, _column in TRIGRAM_INDEXES:
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('home', '0022_badge_userbadge'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes, atomic=False),
+    ]
@@ -52,6 +52,34 @@ REMEMBER: You are a help assistant for a language learning platform. Nothing els
     # Maximum context length (in characters) to send to OpenAI
     MAX_CONTEXT_LENGTH = 3000
 
+    # Harmful content patterns (substring match against the lowercased query).
+    # Built once here rather than on every _is_harmful_query call.
+    HARMFUL_KEYWORDS = (
+        # Adult/sexual content
+        'porn', 'xxx', 'sex', 'nude', 'naked', 'adult content', 'nsfw',
+        # Violence/weapons
+        'bomb', 'weapon', 'gun', 'explosive', 'kill', 'murder', 'terrorist',
+        'violence', 'attack', 'assault',
+        # Illegal activities
+        'hack', 'crack', 'pirate', 'steal', 'illegal', 'drug', 'cocaine',
+        'heroin', 'meth', 'fraud', 'scam',
+        # Malicious intent
+        'ddos', 'malware', 'virus', 'exploit', 'vulnerability',
+        # Other inappropriate
+        'suicide', 'self-harm', 'self harm'
+    )
+
+    # Anything related to language learning or the platform; short queries
+    # without one of these are treated as off-topic
+    PLATFORM_KEYWORDS = (
+        'learn', 'language', 'account', 'login', 'password', 'profile',
+        'quest', 'daily', 'points', 'streak', 'lesson', 'practice',
+        'dashboard', 'progress', 'achievement', 'badge', 'leaderboard',
+        'vocabulary', 'grammar', 'exercise', 'platform', 'help', 'how',
+        'what', 'where', 'when', 'can i', 'do i', 'reset', 'change',
+        'update', 'delete', 'create', 'sign up', 'register', 'email'
+    )
+
     @staticmethod
     def get_ai_response(query: str, user_role: str = 'user',
                        chat_history: Optional[List[Dict]] = None) -> Dict[str, any]:
@@ -241,42 +269,18 @@ REMEMBER: You are a help assistant for a language learning platform. Nothing els
         """
         query_lower = query.lower()
 
-        # Harmful content patterns
-        harmful_keywords = [
-            # Adult/sexual content
-            'porn', 'xxx', 'sex', 'nude', 'naked', 'adult content', 'nsfw',
-            # Violence/weapons
-            'bomb', 'weapon', 'gun', 'explosive', 'kill', 'murder', 'terrorist',
-            'violence', 'attack', 'assault',
-            # Illegal activities
-            'hack', 'crack', 'pirate', 'steal', 'illegal', 'drug', 'cocaine',
-            'heroin', 'meth', 'fraud', 'scam',
-            # Malicious intent
-            'ddos', 'malware', 'virus', 'exploit', 'vulnerability',
-            # Other inappropriate
-            'suicide', 'self-harm', 'self harm'
-        ]
-
         # Check for harmful keywords
-        for keyword in harmful_keywords:
+        for keyword in ChatbotService.HARMFUL_KEYWORDS:
             if keyword in query_lower:
                 return True
 
         # Check if query is clearly off-topic (no platform-related keywords)
-        # If query doesn't mention anything related to language learning or the platform
-        platform_keywords = [
-            'learn', 'language', 'account', 'login', 'password', 'profile',
-            'quest', 'daily', 'points', 'streak', 'lesson', 'practice',
-            'dashboard', 'progress', 'achievement', 'badge', 'leaderboard',
-            'vocabulary', 'grammar', 'exercise', 'platform', 'help', 'how',
-            'what', 'where', 'when', 'can i', 'do i', 'reset', 'change',
-            'update', 'delete', 'create', 'sign up', 'register', 'email'
-        ]
-
         # If query is very short (1-2 words) and contains no platform keywords, it's suspicious
         words = query_lower.split()
         if len(words) <= 2:
-            has_platform_keyword = any(keyword in query_lower for keyword in platform_keywords)
+            has_platform_keyword = any(
+                keyword in query_lower for keyword in ChatbotService.PLATFORM_KEYWORDS
+            )
             if not has_platform_keyword:
                 return True  # Likely off-topic or probing
 
@@ -131,11 +131,15 @@ class DailyQuestService:
     def calculate_quest_score(quest: DailyQuest, answers: Dict[str, str]) -> Tuple[int, int]:
         """
         Count how many answers are correct for the given quest submission.
+
+        Loads the questions once (no query at all if the caller prefetched
+        ``questions``) and derives the total from that list.
         """
+        questions = list(quest.questions.all())
         correct = 0
-        total = quest.questions.count()
+        total = len(questions)
 
-        for question in quest.questions.all():
+        for question in questions:
             raw_value = answers.get(f'question_{question.id}')
             try:
                 selected_index = int(raw_value)
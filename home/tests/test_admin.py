@@ -1,38 +1,80 @@
-from django.contrib.auth.models import User
+from unittest import skipUnless
+
+import pytest
+from django.conf import settings
+from django.contrib.admin import site as admin_site
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.messages import get_messages
-from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.messages.storage.base import BaseStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connection, transaction
 from django.http import HttpRequest
-from django.test import Client, TestCase
+from django.test import (Client, RequestFactory, SimpleTestCase, TestCase, override_settings,
+                         tag)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from home.admin import delete_user_avatars, delete_user_avatars_from_users
-from home.models import LessonCompletion, QuizResult, UserProgress
+from home.models import LessonCompletion, QuizResult, UserProfile, UserProgress
 
-from .test_utils import AdminTestCase, create_test_superuser, create_test_user
+from .test_utils import (AdminTestCase, create_test_user, get_shared_superuser,
+                         user_profile_signals_disabled)
+
+# One superuser for every admin test class in this module (see conftest.py)
+pytestmark = pytest.mark.usefixtures('shared_admin_user')
 
 # ============================================================================
 # ADMIN TESTS
 # ============================================================================
 
+# UserProgress columns zeroed by the reset actions (refreshed without reloading the row)
+PROGRESS_STAT_FIELDS = [
+    'total_minutes_studied',
+    'total_lessons_completed',
+    'total_quizzes_taken',
+    'overall_quiz_accuracy',
+]
+
+
+class _InMemoryMessageStorage(BaseStorage):
+    """Message storage that keeps messages on the instance (no session/cookie I/O)"""
+
+    def _get(self, *args, **kwargs):
+        return [], True
+
+    def _store(self, messages, response, *args, **kwargs):
+        return []
+
+
+def _make_admin_request(user=None):
+    """Build a bare request that admin actions can attach messages to"""
+    request = HttpRequest()
+    if user is not None:
+        request.user = user
+    setattr(request, '_messages', _InMemoryMessageStorage(request))
+    return request
+
+
 class TestAdminCustomActions(TestCase):
     """Test custom admin actions for user management"""
 
-    def setUp(self):
-        """Create test users and admin user"""
-        self.admin_user = User.objects.create_superuser(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123'
-        )
-        self.test_user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='OldSecurePass456!@#'
-        )
-        self.test_user2 = User.objects.create_user(
-            username='testuser2',
-            email='test2@example.com',
-            password='OldSecurePass456!@#'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Create test users and admin user (no profiles; avatar tests add their own)"""
+        cls.admin_user = get_shared_superuser()
+        with user_profile_signals_disabled():
+            cls.test_user = User.objects.create_user(
+                username='testuser',
+                email='test@example.com',
+                password='OldSecurePass456!@#'
+            )
+            cls.test_user2 = User.objects.create_user(
+                username='testuser2',
+                email='test2@example.com',
+                password='OldSecurePass456!@#'
+            )
 
     def test_reset_password_to_default_action(self):
         """Test admin action to reset user password to secure random password"""
@@ -45,17 +87,14 @@ class TestAdminCustomActions(TestCase):
         old_password = self.test_user.password
 
         # Create mock request and queryset
-        request = HttpRequest()
-        # Setup messages framework
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = User.objects.filter(username='testuser')
 
         # Execute the action
         reset_password_to_default(UserAdmin(User, AdminSite()), request, queryset)
 
         # Verify password was changed
-        self.test_user.refresh_from_db()
+        self.test_user.refresh_from_db(fields=['password'])
         self.assertNotEqual(self.test_user.password, old_password)
 
         # Verify a message was sent with the new password
@@ -76,17 +115,14 @@ class TestAdminCustomActions(TestCase):
         self.assertFalse(self.test_user.is_staff)
         self.assertFalse(self.test_user.is_superuser)
 
-        request = HttpRequest()
-        # Setup messages framework
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = User.objects.filter(username='testuser')
 
         # Execute the action
         make_staff_admin(UserAdmin(User, AdminSite()), request, queryset)
 
         # Verify user is now admin
-        self.test_user.refresh_from_db()
+        self.test_user.refresh_from_db(fields=['is_staff', 'is_superuser'])
         self.assertTrue(self.test_user.is_staff)
         self.assertTrue(self.test_user.is_superuser)
 
@@ -102,17 +138,14 @@ class TestAdminCustomActions(TestCase):
         self.test_user.is_superuser = True
         self.test_user.save()
 
-        request = HttpRequest()
-        # Setup messages framework
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = User.objects.filter(username='testuser')
 
         # Execute the action
         remove_admin_privileges(UserAdmin(User, AdminSite()), request, queryset)
 
         # Verify admin privileges removed
-        self.test_user.refresh_from_db()
+        self.test_user.refresh_from_db(fields=['is_staff', 'is_superuser'])
         self.assertFalse(self.test_user.is_staff)
         self.assertFalse(self.test_user.is_superuser)
 
@@ -123,37 +156,32 @@ class TestAdminCustomActions(TestCase):
 
         from home.admin import reset_user_progress
 
-        # Create progress data for user
-        progress = UserProgress.objects.create(
-            user=self.test_user,
-            total_minutes_studied=100,
-            total_lessons_completed=10,
-            total_quizzes_taken=5,
-            overall_quiz_accuracy=85.0
-        )
-        LessonCompletion.objects.create(
-            user=self.test_user,
-            lesson_id='lesson1',
-            duration_minutes=30
-        )
-        QuizResult.objects.create(
-            user=self.test_user,
-            quiz_id='quiz1',
-            score=8,
-            total_questions=10
-        )
-
-        request = HttpRequest()
-        # Setup messages framework
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        # Create progress data for user (one batch per table, single transaction)
+        with transaction.atomic():
+            [progress] = UserProgress.objects.bulk_create([
+                UserProgress(
+                    user=self.test_user,
+                    total_minutes_studied=100,
+                    total_lessons_completed=10,
+                    total_quizzes_taken=5,
+                    overall_quiz_accuracy=85.0
+                ),
+            ])
+            LessonCompletion.objects.bulk_create([
+                LessonCompletion(user=self.test_user, lesson_id='lesson1', duration_minutes=30),
+            ])
+            QuizResult.objects.bulk_create([
+                QuizResult(user=self.test_user, quiz_id='quiz1', score=8, total_questions=10),
+            ])
+
+        request = _make_admin_request()
         queryset = User.objects.filter(username='testuser')
 
         # Execute the action
         reset_user_progress(UserAdmin(User, AdminSite()), request, queryset)
 
         # Verify progress was reset
-        progress.refresh_from_db()
+        progress.refresh_from_db(fields=PROGRESS_STAT_FIELDS)
         self.assertEqual(progress.total_minutes_studied, 0)
         self.assertEqual(progress.total_lessons_completed, 0)
         self.assertEqual(progress.total_quizzes_taken, 0)
@@ -178,35 +206,19 @@ class TestAdminCustomActions(TestCase):
             overall_quiz_accuracy=85.0
         )
 
-        request = HttpRequest()
-        # Setup messages framework
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = UserProgress.objects.filter(user=self.test_user)
 
         # Execute the action
         reset_progress_stats(UserProgressAdmin(UserProgress, AdminSite()), request, queryset)
 
         # Verify stats were reset
-        progress.refresh_from_db()
+        progress.refresh_from_db(fields=PROGRESS_STAT_FIELDS)
         self.assertEqual(progress.total_minutes_studied, 0)
         self.assertEqual(progress.total_lessons_completed, 0)
         self.assertEqual(progress.total_quizzes_taken, 0)
         self.assertEqual(progress.overall_quiz_accuracy, 0.0)
 
-    def test_admin_page_accessible_for_superuser(self):
-        """Test that admin page is accessible for superuser"""
-        self.client.login(username='admin', password='adminpass123')
-        response = self.client.get('/admin/')
-        self.assertEqual(response.status_code, 200)
-
-    def test_admin_page_not_accessible_for_regular_user(self):
-        """Test that admin page is not accessible for regular user"""
-        self.client.login(username='testuser', password='OldSecurePass456!@#')
-        response = self.client.get('/admin/')
-        # Should redirect to login page
-        self.assertEqual(response.status_code, 302)
-
     def test_admin_user_list_display(self):
         """Test custom user admin list display"""
         from django.contrib.admin.sites import AdminSite
@@ -281,23 +293,15 @@ class TestAdminCustomActions(TestCase):
         from home.admin import LessonCompletionAdmin, delete_selected_lessons
 
         # Create lesson completions
-        _lesson1 = LessonCompletion.objects.create(
-            user=self.test_user,
-            lesson_id='lesson1',
-            duration_minutes=30
-        )
-        _lesson2 = LessonCompletion.objects.create(
-            user=self.test_user,
-            lesson_id='lesson2',
-            duration_minutes=45
-        )
+        LessonCompletion.objects.bulk_create([
+            LessonCompletion(user=self.test_user, lesson_id='lesson1', duration_minutes=30),
+            LessonCompletion(user=self.test_user, lesson_id='lesson2', duration_minutes=45),
+        ])
 
         # Verify they exist
         self.assertEqual(LessonCompletion.objects.count(), 2)
 
-        request = HttpRequest()
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = LessonCompletion.objects.all()
 
         # Execute the action
@@ -326,25 +330,15 @@ class TestAdminCustomActions(TestCase):
         from home.admin import QuizResultAdmin, delete_selected_quizzes
 
         # Create quiz results
-        _quiz1 = QuizResult.objects.create(
-            user=self.test_user,
-            quiz_id='quiz1',
-            score=8,
-            total_questions=10
-        )
-        _quiz2 = QuizResult.objects.create(
-            user=self.test_user,
-            quiz_id='quiz2',
-            score=15,
-            total_questions=20
-        )
+        QuizResult.objects.bulk_create([
+            QuizResult(user=self.test_user, quiz_id='quiz1', score=8, total_questions=10),
+            QuizResult(user=self.test_user, quiz_id='quiz2', score=15, total_questions=20),
+        ])
 
         # Verify they exist
         self.assertEqual(QuizResult.objects.count(), 2)
 
-        request = HttpRequest()
-        setattr(request, 'session', {})
-        setattr(request, '_messages', FallbackStorage(request))
+        request = _make_admin_request()
         queryset = QuizResult.objects.all()
 
         # Execute the action
@@ -366,27 +360,23 @@ class TestAdminCustomActions(TestCase):
         from home.models import UserProfile
 
         # Set avatar directly without image processing
-        profile = self.test_user.profile
+        profile = UserProfile.objects.create(user=self.test_user)
         profile.avatar.save('test_avatar.jpg', ContentFile(b'fake image'), save=False)
         UserProfile.objects.filter(pk=profile.pk).update(avatar=profile.avatar.name)
-        profile.refresh_from_db()
+        profile.refresh_from_db(fields=['avatar'])
 
         # Verify avatar field is set
         self.assertTrue(profile.avatar)
 
         # Create request and add message storage
-        request = HttpRequest()
-        request.user = self.admin_user
-        setattr(request, 'session', 'session')
-        messages_storage = FallbackStorage(request)
-        setattr(request, '_messages', messages_storage)
+        request = _make_admin_request(user=self.admin_user)
 
         # Execute action
         queryset = UserProfile.objects.filter(user=self.test_user)
         delete_user_avatars(None, request, queryset)
 
         # Verify avatar was deleted
-        profile.refresh_from_db()
+        profile.refresh_from_db(fields=['avatar'])
         self.assertFalse(profile.avatar)
 
         # Check success message
@@ -401,29 +391,26 @@ class TestAdminCustomActions(TestCase):
         from home.models import UserProfile
 
         # Set avatar directly without image processing
-        profile = self.test_user.profile
+        profile = UserProfile.objects.create(user=self.test_user)
         profile.avatar.save('test_avatar2.jpg', ContentFile(b'fake image 2'), save=False)
         UserProfile.objects.filter(pk=profile.pk).update(avatar=profile.avatar.name)
-        profile.refresh_from_db()
+        profile.refresh_from_db(fields=['avatar'])
 
         # User 2 has no avatar (uses Gravatar)
+        UserProfile.objects.create(user=self.test_user2)
 
         # Verify avatar exists for user 1
         self.assertTrue(profile.avatar)
 
         # Create request and add message storage
-        request = HttpRequest()
-        request.user = self.admin_user
-        setattr(request, 'session', 'session')
-        messages_storage = FallbackStorage(request)
-        setattr(request, '_messages', messages_storage)
+        request = _make_admin_request(user=self.admin_user)
 
         # Execute action on both users
         queryset = User.objects.filter(username__in=['testuser', 'testuser2'])
         delete_user_avatars_from_users(None, request, queryset)
 
         # Verify avatar was deleted for user 1
-        profile.refresh_from_db()
+        profile.refresh_from_db(fields=['avatar'])
         self.assertFalse(profile.avatar)
 
         # Check messages
@@ -437,12 +424,13 @@ class TestAdminCustomActions(TestCase):
         from home.models import UserProfile
 
         # Both users use Gravatar (no custom avatars)
+        UserProfile.objects.bulk_create([
+            UserProfile(user=self.test_user),
+            UserProfile(user=self.test_user2),
+        ])
+
         # Create request and add message storage
-        request = HttpRequest()
-        request.user = self.admin_user
-        setattr(request, 'session', 'session')
-        messages_storage = FallbackStorage(request)
-        setattr(request, '_messages', messages_storage)
+        request = _make_admin_request(user=self.admin_user)
 
         # Execute action
         queryset = UserProfile.objects.filter(user__in=[self.test_user, self.test_user2])
@@ -458,6 +446,8 @@ class TestAdminCustomActions(TestCase):
 # ADMIN CRUD TESTS
 # ============================================================================
 
+@pytest.mark.slow
+@tag('slow', 'admin_e2e')
 class TestAdminCRUDOperations(AdminTestCase):
     """Test admin CRUD operations for all models."""
     def test_delete_user_through_admin(self):
@@ -525,7 +515,7 @@ class TestAdminCRUDOperations(AdminTestCase):
         })
 
         # Refresh from database
-        progress.refresh_from_db()
+        progress.refresh_from_db(fields=['total_minutes_studied', 'total_lessons_completed'])
 
         # Values should be updated
         self.assertEqual(progress.total_minutes_studied, 150)
@@ -539,7 +529,7 @@ class TestAdminCRUDOperations(AdminTestCase):
             password='testpass123'
         )
 
-        response = self.client.post('/admin/home/lessoncompletion/add/', {
+        response = self.client.post(reverse('admin:home_lessoncompletion_add'), {
             'user': test_user.pk,
             'lesson_id': 'lesson_001',
             'lesson_title': 'Introduction to Spanish',
@@ -561,7 +551,7 @@ class TestAdminCRUDOperations(AdminTestCase):
             password='testpass123'
         )
 
-        response = self.client.post('/admin/home/quizresult/add/', {
+        response = self.client.post(reverse('admin:home_quizresult_add'), {
             'user': test_user.pk,
             'quiz_id': 'quiz_001',
             'quiz_title': 'Spanish Vocabulary',
@@ -577,11 +567,85 @@ class TestAdminCRUDOperations(AdminTestCase):
         self.assertTrue(QuizResult.objects.filter(quiz_id='quiz_001').exists())
 
 
+# ============================================================================
+# ADMIN FORM TESTS
+# ============================================================================
+
+class TestAdminForms(TestCase):
+    """Drive ModelAdmin forms and save_model() directly, without the admin views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create (or reuse the module-shared) admin user and a learner"""
+        cls.admin_user = get_shared_superuser()
+        cls.test_user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+    def test_lesson_completion_admin_form_saves(self):
+        """LessonCompletionAdmin form validates and save_model() creates the row"""
+        from django.contrib.admin.sites import AdminSite
+
+        from home.admin import LessonCompletionAdmin
+
+        model_admin = LessonCompletionAdmin(LessonCompletion, AdminSite())
+        request = RequestFactory().post(reverse('admin:home_lessoncompletion_add'))
+        request.user = self.admin_user
+        form = model_admin.get_form(request)(data={
+            'user': self.test_user.pk,
+            'lesson_id': 'lesson_001',
+            'lesson_title': 'Introduction to Spanish',
+            'duration_minutes': 30,
+            'language': 'Spanish',
+        })
+
+        # Form should validate with the admin's field configuration
+        self.assertTrue(form.is_valid(), form.errors)
+        model_admin.save_model(request, form.save(commit=False), form, change=False)
+
+        # Lesson completion should be created
+        self.assertTrue(LessonCompletion.objects.filter(lesson_id='lesson_001').exists())
+
+    def test_quiz_result_admin_form_saves(self):
+        """QuizResultAdmin form validates and save_model() creates the row"""
+        from django.contrib.admin.sites import AdminSite
+
+        from home.admin import QuizResultAdmin
+
+        model_admin = QuizResultAdmin(QuizResult, AdminSite())
+        request = RequestFactory().post(reverse('admin:home_quizresult_add'))
+        request.user = self.admin_user
+        form = model_admin.get_form(request)(data={
+            'user': self.test_user.pk,
+            'quiz_id': 'quiz_001',
+            'quiz_title': 'Spanish Vocabulary',
+            'score': 18,
+            'total_questions': 20,
+            'language': 'Spanish',
+        })
+
+        # Form should validate with the admin's field configuration
+        self.assertTrue(form.is_valid(), form.errors)
+        model_admin.save_model(request, form.save(commit=False), form, change=False)
+
+        # Quiz result should be created
+        self.assertTrue(QuizResult.objects.filter(quiz_id='quiz_001').exists())
+
 
 # ============================================================================
 # ADMIN SEARCH AND FILTER TESTS
 # ============================================================================
 
+# Admin changelist query budget: session + user load, filtered and total counts,
+# one list query with its FKs joined, and the session save (savepoint + update).
+# Growing this number means a list_display column started querying per row.
+CHANGELIST_QUERIES = 8
+
+
+@pytest.mark.slow
+@tag('slow', 'admin_e2e')
 class TestAdminSearchAndFilters(AdminTestCase):
     """Test admin search and filter functionality."""
 
@@ -590,23 +654,34 @@ class TestAdminSearchAndFilters(AdminTestCase):
         """Create reusable test data (runs once per test class)"""
         super().setUpTestData()  # Create admin user from base class
 
-        # Create test users for search/filter testing
-        cls.user1 = User.objects.create_user(
-            username='john',
-            email='john@example.com',
-            first_name='John',
-            last_name='Doe'
-        )
-        cls.user2 = User.objects.create_user(
-            username='jane',
-            email='jane@example.com',
-            first_name='Jane',
-            last_name='Smith'
-        )
+        # Create test users for search/filter testing. These users never log in,
+        # so bulk insert them with unusable passwords (no hashing, one INSERT).
+        cls.user1, cls.user2 = User.objects.bulk_create([
+            User(
+                username='john',
+                email='john@example.com',
+                first_name='John',
+                last_name='Doe',
+                password=make_password(None)
+            ),
+            User(
+                username='jane',
+                email='jane@example.com',
+                first_name='Jane',
+                last_name='Smith',
+                password=make_password(None)
+            ),
+        ])
+        # bulk_create skips post_save, so add the profiles the signal would create
+        UserProfile.objects.bulk_create([
+            UserProfile(user=cls.user1),
+            UserProfile(user=cls.user2),
+        ])
 
     def test_user_search_by_username(self):
         """Test searching users by username in admin"""
-        response = self.client.get('/admin/auth/user/', {'q': 'john'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/auth/user/', {'q': 'john'})
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'john')
@@ -614,7 +689,8 @@ class TestAdminSearchAndFilters(AdminTestCase):
 
     def test_user_search_by_email(self):
         """Test searching users by email in admin"""
-        response = self.client.get('/admin/auth/user/', {'q': 'jane@example.com'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/auth/user/', {'q': 'jane@example.com'})
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'jane')
@@ -625,7 +701,8 @@ class TestAdminSearchAndFilters(AdminTestCase):
         self.user1.is_staff = True
         self.user1.save()
 
-        response = self.client.get('/admin/auth/user/', {'is_staff__exact': '1'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/auth/user/', {'is_staff__exact': '1'})
 
         self.assertEqual(response.status_code, 200)
         # Should show john (staff) and admin, but not jane
@@ -639,7 +716,8 @@ class TestAdminSearchAndFilters(AdminTestCase):
             total_minutes_studied=100
         )
 
-        response = self.client.get('/admin/home/userprogress/', {'q': 'john'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/home/userprogress/', {'q': 'john'})
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'john')
@@ -652,7 +730,8 @@ class TestAdminSearchAndFilters(AdminTestCase):
             lesson_title='Spanish Basics'
         )
 
-        response = self.client.get('/admin/home/lessoncompletion/', {'q': 'Spanish'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/home/lessoncompletion/', {'q': 'Spanish'})
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Spanish Basics')
@@ -667,11 +746,23 @@ class TestAdminSearchAndFilters(AdminTestCase):
             total_questions=20
         )
 
-        response = self.client.get('/admin/home/quizresult/', {'q': 'Vocabulary'})
+        with self.assertNumQueries(CHANGELIST_QUERIES):
+            response = self.client.get('/admin/home/quizresult/', {'q': 'Vocabulary'})
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Vocabulary')
 
+    @skipUnless(connection.vendor == 'postgresql', 'pg_trgm indexes are PostgreSQL-only')
+    def test_user_search_uses_trigram_index(self):
+        """Admin username search (UPPER(username) LIKE '%Q%') should use the trigram index"""
+        queryset = User.objects.filter(username__icontains='john')
+        with connection.cursor() as cursor:
+            # Tiny test tables would otherwise always be seq-scanned
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+
+        self.assertIn('auth_user_username_trgm', plan)
+
     def test_admin_list_filters_present(self):
         """Test that admin list filters are configured"""
         from django.contrib.admin.sites import AdminSite
@@ -686,151 +777,177 @@ class TestAdminSearchAndFilters(AdminTestCase):
         self.assertIn('is_superuser', admin.list_filter)
 
 
-
 # ============================================================================
 # ADMIN LOGIN FLOW TESTS
 # ============================================================================
 
+@override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies')
 class TestAdminLoginFlow(TestCase):
-    """Test admin authentication and access control."""
+    """
+    Test admin authentication and access control.
+
+    Only the login tests POST credentials to /admin/login/; everything else
+    reuses a session created once with force_login() in setUpTestData, so the
+    password hasher runs only where it is under test. Sessions live in signed
+    cookies here, so logins and per-request session saves skip django_session.
+    """
 
     @classmethod
     def setUpTestData(cls):
         """Create reusable test data with factory methods (no hardcoded credentials)"""
-        # Create admin user for authentication testing
-        cls.admin_user = create_test_superuser()
+        # Admin user for authentication testing (shared across this module)
+        cls.admin_user = get_shared_superuser()
+        cls.ADMIN_PW = cls.admin_user._test_password
         # Create regular user to test access denial
         cls.regular_user = create_test_user()
+        # A few rows per progress model so the changelist query budgets below
+        # would catch a per-row (N+1) query in list_display
+        UserProgress.objects.create(user=cls.regular_user, total_minutes_studied=30)
+        LessonCompletion.objects.bulk_create([
+            LessonCompletion(user=cls.regular_user, lesson_id=f'lesson_{i}',
+                             lesson_title=f'Lesson {i}', duration_minutes=10)
+            for i in range(3)
+        ])
+        QuizResult.objects.bulk_create([
+            QuizResult(user=cls.regular_user, quiz_id=f'quiz_{i}',
+                       quiz_title=f'Quiz {i}', score=8, total_questions=10)
+            for i in range(3)
+        ])
+
+        # Resolve admin URLs once per class instead of hardcoding paths
+        cls.URLS = {
+            'index': reverse('admin:index'),
+            'login': reverse('admin:login'),
+            'logout': reverse('admin:logout'),
+            'user_cl': reverse('admin:auth_user_changelist'),
+            'up_cl': reverse('admin:home_userprogress_changelist'),
+            'lc_cl': reverse('admin:home_lessoncompletion_changelist'),
+            'qr_cl': reverse('admin:home_quizresult_changelist'),
+        }
+
+        # Authenticate once per class; tests reuse the session cookies
+        cls._admin_session_cookie = cls._build_session_cookie(cls.admin_user)
+        cls._regular_session_cookie = cls._build_session_cookie(cls.regular_user)
+
+    @staticmethod
+    def _build_session_cookie(user):
+        """Log user in with a throwaway client and return its session cookie value"""
+        client = Client()
+        client.force_login(user)
+        return client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def _use_session(self, session_cookie):
+        """Attach a session cookie built in setUpTestData to the test client"""
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+
+    def _post_admin_login(self, data):
+        """
+        Call the admin login view directly with a RequestFactory POST.
 
-    def setUp(self):
-        """Set up test client (runs before each test)"""
-        self.client = Client()
+        Only the session is needed by the login view, so the rest of the
+        middleware stack is skipped; the response is left unrendered.
+        """
+        request = RequestFactory().post(self.URLS['login'], data)
+        SessionMiddleware(lambda req: None).process_request(request)
+        request.user = AnonymousUser()
+        request._dont_enforce_csrf_checks = True  # pylint: disable=protected-access
+        return admin_site.login(request)
 
     def test_admin_login_successful(self):
         """Test successful admin login"""
-        response = self.client.post('/admin/login/', {
+        response = self._post_admin_login({
             'username': self.admin_user.username,
-            'password': self.admin_user._test_password,
-            'next': '/admin/'
+            'password': self.ADMIN_PW,
+            'next': self.URLS['index']
         })
 
-        # Should redirect to admin index
-        self.assertEqual(response.status_code, 302)
-        self.assertTrue(response.url.startswith('/admin/'))
+        # Should redirect to admin index (without requesting it)
+        self.assertRedirects(response, self.URLS['index'], fetch_redirect_response=False)
 
     def test_admin_login_invalid_credentials(self):
         """Test admin login with invalid credentials"""
-        response = self.client.post('/admin/login/', {
+        response = self._post_admin_login({
             'username': self.admin_user.username,
             'password': 'wrongpassword',
         })
 
-        # Should stay on login page
+        # Should stay on login page with a form error (template not rendered)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Please enter the correct username and password')
+        self.assertIn(
+            'Please enter the correct username and password',
+            ' '.join(response.context_data['form'].non_field_errors())
+        )
 
     def test_regular_user_cannot_access_admin(self):
         """Test that regular users cannot access admin"""
-        self.client.login(
-            username=self.regular_user.username,
-            password=self.regular_user._test_password
-        )
+        self._use_session(self._regular_session_cookie)
 
-        response = self.client.get('/admin/')
+        response = self.client.get(self.URLS['index'])
 
         # Should redirect to login page
-        self.assertEqual(response.status_code, 302)
-        self.assertIn('/admin/login/', response.url)
+        self.assertRedirects(
+            response, f"{self.URLS['login']}?next={self.URLS['index']}",
+            fetch_redirect_response=False
+        )
 
     def test_admin_logout(self):
         """Test admin logout"""
         # Login first
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
-        )
+        self._use_session(self._admin_session_cookie)
 
-        # Access admin to verify logged in
-        response = self.client.get('/admin/')
-        self.assertEqual(response.status_code, 200)
+        # Verify logged in from the session (no admin index render needed)
+        self.assertIn(SESSION_KEY, self.client.session)
 
         # Logout (requires POST in modern Django)
-        response = self.client.post('/admin/logout/')
+        response = self.client.post(self.URLS['logout'])
 
-        # Should redirect or show logout confirmation
+        # Should redirect or show logout confirmation, and clear the session
         self.assertIn(response.status_code, [200, 302])
+        self.assertNotIn(SESSION_KEY, self.client.session)
 
         # Try to access admin again (should redirect to login)
-        response = self.client.get('/admin/')
+        response = self.client.get(self.URLS['index'])
         self.assertEqual(response.status_code, 302)
 
-    def test_admin_access_user_changelist(self):
-        """Test admin can access user changelist"""
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
-        )
-
-        response = self.client.get('/admin/auth/user/')
-
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Select user to change')
-
-    def test_admin_access_user_progress_changelist(self):
-        """Test admin can access UserProgress changelist"""
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
-        )
-
-        response = self.client.get('/admin/home/userprogress/')
-
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'user progress')
-
-    def test_admin_access_lesson_completion_changelist(self):
-        """Test admin can access LessonCompletion changelist"""
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
-        )
-
-        response = self.client.get('/admin/home/lessoncompletion/')
-
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'lesson completion')
-
-    def test_admin_access_quiz_result_changelist(self):
-        """Test admin can access QuizResult changelist"""
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
-        )
-
-        response = self.client.get('/admin/home/quizresult/')
-
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'quiz result')
+    def test_admin_changelists_accessible(self):
+        """Test admin can access the index and each progress-model changelist"""
+        self._use_session(self._admin_session_cookie)
+
+        # (url, query budget, expected bytes); the index lists the models by
+        # verbose name. Changelists cost 4 queries (session user, two COUNTs,
+        # the page) however many rows they show - a per-row query in
+        # list_display pushes them over budget.
+        pages = [
+            (self.URLS['user_cl'], 4, [b'Select user to change']),
+            (self.URLS['up_cl'], 4, [b'user progress']),
+            (self.URLS['lc_cl'], 4, [b'lesson completion']),
+            (self.URLS['qr_cl'], 4, [b'quiz result']),
+            (self.URLS['index'], 2, [b'User Progress', b'Lesson Completions', b'Quiz Results']),
+        ]
+        for url, max_queries, expected_texts in pages:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(url)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertLessEqual(
+                    len(ctx.captured_queries), max_queries,
+                    f'{url} ran {len(ctx.captured_queries)} queries'
+                )
+                # Substring checks on the raw bytes; no decode per assertion
+                body = response.content
+                for text in expected_texts:
+                    self.assertIn(text, body)
+
+
+class TestAdminLoginFlowReadOnly(SimpleTestCase):
+    """Admin access checks that need no database (no per-test transaction)."""
 
     def test_unauthenticated_user_redirected_to_login(self):
         """Test unauthenticated users are redirected to admin login"""
-        response = self.client.get('/admin/')
-
-        self.assertEqual(response.status_code, 302)
-        self.assertIn('/admin/login/', response.url)
+        response = self.client.get(reverse('admin:index'))
 
-    def test_admin_index_shows_models(self):
-        """Test admin index page shows all registered models"""
-        self.client.login(
-            username=self.admin_user.username,
-            password=self.admin_user._test_password
+        self.assertRedirects(
+            response, f"{reverse('admin:login')}?next={reverse('admin:index')}",
+            fetch_redirect_response=False
         )
-
-        response = self.client.get('/admin/')
-
-        self.assertEqual(response.status_code, 200)
-        # Should show User Progress models (case-sensitive based on model verbose names)
-        self.assertContains(response, 'User Progress')
-        self.assertContains(response, 'Lesson Completions')
-        self.assertContains(response, 'Quiz Results')
-
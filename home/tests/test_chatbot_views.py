@@ -7,69 +7,96 @@ Following TDD: Tests written before implementation.
 import json
 from unittest.mock import patch
 
-from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import RequestFactory, SimpleTestCase, TestCase
 from django.urls import reverse
 
+from home.views import chatbot_query
 
-class ChatbotAPITests(TestCase):
-    """Test chatbot API endpoint"""
+# Request bodies reused across tests, serialised once at import
+EMPTY_BODY = json.dumps({})
+TEST_QUERY_BODY = json.dumps({'query': 'Test query'})
+ACCOUNT_QUERY_BODY = json.dumps({'query': 'How do I create an account?'})
+
+# Service result shared by tests that only check the view's status/role
+# handling. The view passes it to JsonResponse unchanged, so sharing is safe.
+TEST_RESPONSE = {'response': 'Test response', 'sources': []}
+
+
+class ChatbotServiceMockMixin:
+    """
+    Patch ChatbotService.get_ai_response once for the whole test class.
+
+    setUp resets the mock; tests set ``self.mock_service.return_value`` and
+    post JSON bodies with ``_post_query``.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.url = reverse('chatbot_query')
+        cls._service_patcher = patch('home.services.chatbot_service.ChatbotService.get_ai_response')
+        cls.mock_service = cls._service_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._service_patcher.stop()
+        super().tearDownClass()
 
     def setUp(self):
-        """Set up test client and users"""
-        self.client = Client()
+        super().setUp()
+        self.mock_service.reset_mock(return_value=True, side_effect=True)
 
-        self.regular_user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
+    def _post_query(self, body):
+        """POST a raw JSON body to the chatbot query endpoint"""
+        return self.client.post(self.url, data=body, content_type='application/json')
 
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            password='adminpass123',
-            is_staff=True
-        )
+
+class ChatbotAPITests(ChatbotServiceMockMixin, SimpleTestCase):
+    """
+    Test chatbot API view logic as a guest.
+
+    Requests come from a RequestFactory and go straight to the view, skipping
+    the middleware stack; the service is mocked, so no database is needed.
+    The full Client path is covered by ChatbotAPIAuthenticatedTests.
+    """
+
+    def setUp(self):
+        """Set up request factory"""
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def _post_query(self, body):
+        """Call chatbot_query directly with a guest POST of a raw JSON body"""
+        request = self.factory.post(self.url, data=body, content_type='application/json')
+        request.user = AnonymousUser()
+        return chatbot_query(request)
 
     def test_chatbot_query_url_exists(self):
         """URL for chatbot query should exist"""
-        url = reverse('chatbot_query')
-        self.assertIsNotNone(url)
+        self.assertIsNotNone(self.url)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_accepts_post(self, mock_service):
+    def test_chatbot_query_accepts_post(self):
         """Chatbot query endpoint should accept POST requests"""
-        mock_service.return_value = {
-            'response': 'Test response',
-            'sources': []
-        }
+        self.mock_service.return_value = TEST_RESPONSE
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'How do I create an account?'}),
-            content_type='application/json'
-        )
+        response = self._post_query(ACCOUNT_QUERY_BODY)
 
         self.assertEqual(response.status_code, 200)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_rejects_get(self, mock_service):
+    def test_chatbot_query_rejects_get(self):
         """Chatbot query endpoint should reject GET requests"""
-        response = self.client.get(reverse('chatbot_query'))
+        response = chatbot_query(self.factory.get(self.url))
         self.assertEqual(response.status_code, 405)  # Method Not Allowed
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_returns_json(self, mock_service):
+    def test_chatbot_query_returns_json(self):
         """Chatbot query should return JSON response"""
-        mock_service.return_value = {
+        self.mock_service.return_value = {
             'response': 'To create an account, click Sign Up.',
             'sources': [{'title': 'Creating an Account', 'section_id': 'creating-account'}]
         }
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'How do I create an account?'}),
-            content_type='application/json'
-        )
+        response = self._post_query(ACCOUNT_QUERY_BODY)
 
         self.assertEqual(response['Content-Type'], 'application/json')
 
@@ -77,106 +104,43 @@ class ChatbotAPITests(TestCase):
         self.assertIn('response', data)
         self.assertIn('sources', data)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_for_guest_user(self, mock_service):
+    def test_chatbot_query_for_guest_user(self):
         """Guest users should be able to query chatbot"""
-        mock_service.return_value = {
-            'response': 'Test response',
-            'sources': []
-        }
+        self.mock_service.return_value = TEST_RESPONSE
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'Test query'}),
-            content_type='application/json'
-        )
+        response = self._post_query(TEST_QUERY_BODY)
 
         self.assertEqual(response.status_code, 200)
         # Should pass user_role='user' to service
-        mock_service.assert_called_once()
-        call_kwargs = mock_service.call_args.kwargs
+        self.mock_service.assert_called_once()
+        call_kwargs = self.mock_service.call_args.kwargs
         self.assertEqual(call_kwargs['user_role'], 'user')
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_for_logged_in_user(self, mock_service):
-        """Logged-in users should be able to query chatbot"""
-        self.client.login(username='testuser', password='testpass123')
-
-        mock_service.return_value = {
-            'response': 'Test response',
-            'sources': []
-        }
-
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'Test query'}),
-            content_type='application/json'
-        )
-
-        self.assertEqual(response.status_code, 200)
-
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_for_admin_user(self, mock_service):
-        """Admin users should get admin role for queries"""
-        self.client.login(username='admin', password='adminpass123')
-
-        mock_service.return_value = {
-            'response': 'Admin response',
-            'sources': []
-        }
-
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'How do I manage users?'}),
-            content_type='application/json'
-        )
-
-        self.assertEqual(response.status_code, 200)
-        # Should pass user_role='admin' to service
-        call_kwargs = mock_service.call_args.kwargs
-        self.assertEqual(call_kwargs['user_role'], 'admin')
-
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_requires_query_param(self, mock_service):
+    def test_chatbot_query_requires_query_param(self):
         """Chatbot query should require 'query' parameter"""
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({}),
-            content_type='application/json'
-        )
+        response = self._post_query(EMPTY_BODY)
 
         self.assertEqual(response.status_code, 400)  # Bad Request
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_handles_invalid_json(self, mock_service):
+    def test_chatbot_query_handles_invalid_json(self):
         """Chatbot query should handle invalid JSON gracefully"""
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data='invalid json',
-            content_type='application/json'
-        )
+        response = self._post_query('invalid json')
 
         self.assertEqual(response.status_code, 400)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_handles_service_error(self, mock_service):
+    def test_chatbot_query_handles_service_error(self):
         """Chatbot query should handle service errors gracefully"""
-        mock_service.side_effect = RuntimeError("Service error")
+        self.mock_service.side_effect = RuntimeError("Service error")
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'Test query'}),
-            content_type='application/json'
-        )
+        response = self._post_query(TEST_QUERY_BODY)
 
         self.assertEqual(response.status_code, 500)
         data = json.loads(response.content)
         self.assertIn('error', data)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_with_chat_history(self, mock_service):
+    def test_chatbot_query_with_chat_history(self):
         """Chatbot query should accept optional chat history"""
-        mock_service.return_value = {
+        self.mock_service.return_value = {
             'response': 'Follow-up response',
             'sources': []
         }
@@ -186,21 +150,16 @@ class ChatbotAPITests(TestCase):
             {'role': 'assistant', 'content': 'Click the Login button.'}
         ]
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({
-                'query': 'Where is it?',
-                'chat_history': chat_history
-            }),
-            content_type='application/json'
-        )
+        response = self._post_query(json.dumps({
+            'query': 'Where is it?',
+            'chat_history': chat_history
+        }))
 
         self.assertEqual(response.status_code, 200)
 
-    @patch('home.services.chatbot_service.ChatbotService.get_ai_response')
-    def test_chatbot_query_response_structure(self, mock_service):
+    def test_chatbot_query_response_structure(self):
         """Chatbot query response should have correct structure"""
-        mock_service.return_value = {
+        self.mock_service.return_value = {
             'response': 'Test response',
             'sources': [
                 {
@@ -212,11 +171,7 @@ class ChatbotAPITests(TestCase):
             ]
         }
 
-        response = self.client.post(
-            reverse('chatbot_query'),
-            data=json.dumps({'query': 'What are daily quests?'}),
-            content_type='application/json'
-        )
+        response = self._post_query(json.dumps({'query': 'What are daily quests?'}))
 
         data = json.loads(response.content)
         self.assertIn('response', data)
@@ -227,3 +182,47 @@ class ChatbotAPITests(TestCase):
             source = data['sources'][0]
             self.assertIn('section_id', source)
             self.assertIn('section_title', source)
+
+
+class ChatbotAPIAuthenticatedTests(ChatbotServiceMockMixin, TestCase):
+    """Test chatbot API endpoint for logged-in and admin users"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the users once for the class"""
+        cls.regular_user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+        cls.admin_user = User.objects.create_user(
+            username='admin',
+            password='adminpass123',
+            is_staff=True
+        )
+
+    def test_chatbot_query_for_logged_in_user(self):
+        """Logged-in users should be able to query chatbot"""
+        self.client.force_login(self.regular_user)
+
+        self.mock_service.return_value = TEST_RESPONSE
+
+        response = self._post_query(TEST_QUERY_BODY)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_chatbot_query_for_admin_user(self):
+        """Admin users should get admin role for queries"""
+        self.client.force_login(self.admin_user)
+
+        self.mock_service.return_value = {
+            'response': 'Admin response',
+            'sources': []
+        }
+
+        response = self._post_query(json.dumps({'query': 'How do I manage users?'}))
+
+        self.assertEqual(response.status_code, 200)
+        # Should pass user_role='admin' to service
+        call_kwargs = self.mock_service.call_args.kwargs
+        self.assertEqual(call_kwargs['user_role'], 'admin')
@@ -26,20 +26,20 @@ class TestColorsLessonManagementCommand(TestCase):
         self.assertEqual(lesson.order, 2)
         self.assertTrue(lesson.is_published)
 
-        # Verify flashcards were created
-        cards = list(lesson.cards.all())
-        self.assertEqual(len(cards), 10)
+        # Verify flashcards were created (one query, indexed by English name)
+        cards_by_name = {card.front_text: card for card in lesson.cards.all()}
+        self.assertEqual(len(cards_by_name), 10)
 
         # Check specific color cards
-        red_card = lesson.cards.get(front_text='Red')
+        red_card = cards_by_name['Red']
         self.assertEqual(red_card.back_text, 'Rojo')
         self.assertEqual(red_card.order, 1)
 
-        blue_card = lesson.cards.get(front_text='Blue')
+        blue_card = cards_by_name['Blue']
         self.assertEqual(blue_card.back_text, 'Azul')
         self.assertEqual(blue_card.order, 2)
 
-        white_card = lesson.cards.get(front_text='White')
+        white_card = cards_by_name['White']
         self.assertEqual(white_card.back_text, 'Blanco')
         self.assertEqual(white_card.order, 10)
 
@@ -54,7 +54,7 @@ class TestColorsLessonManagementCommand(TestCase):
         self.assertEqual(q1.correct_index, 1)
 
         # Check question about "Naranja" (orange)
-        orange_q = lesson.quiz_questions.get(question__icontains='orange')
+        orange_q = next(q for q in questions if 'orange' in q.question.lower())
         self.assertEqual(orange_q.options[0], 'Naranja')
         self.assertEqual(orange_q.correct_index, 0)
 
@@ -94,16 +94,22 @@ class TestColorsLessonManagementCommand(TestCase):
 class TestColorsLessonTemplates(TestCase):
     """Test colors lesson template rendering"""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create colors lesson once for the class"""
+        call_command('create_colors_lesson')
+        cls.lesson = Lesson.objects.get(title='Colors in Spanish')
+
     def setUp(self):
-        """Create colors lesson"""
+        """Set up test client for each test"""
         self.client = Client()
-        call_command('create_colors_lesson')
-        self.lesson = Lesson.objects.get(title='Colors in Spanish')
 
     def test_colors_lesson_detail_view(self):
         """Test colors lesson detail page loads successfully"""
         url = reverse('lesson_detail', args=[self.lesson.id])
-        response = self.client.get(url)
+        # Lesson + its flashcards; more means the cards are fetched per row
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'lessons/lesson_detail.html')
 
@@ -113,7 +119,9 @@ class TestColorsLessonTemplates(TestCase):
     def test_colors_quiz_template(self):
         """Test colors quiz template loads with dynamic slug"""
         url = reverse('lesson_quiz', args=[self.lesson.id])
-        response = self.client.get(url)
+        # Lesson + its quiz questions
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'lessons/colors/quiz.html')
 
@@ -130,7 +138,9 @@ class TestColorsLessonTemplates(TestCase):
         )
 
         url = reverse('lesson_results', args=[self.lesson.id, attempt.id])
-        response = self.client.get(url)
+        # Lesson + attempt (colors is the last lesson, so no next_lesson fetch)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'lessons/colors/results.html')
 
@@ -142,134 +152,80 @@ class TestColorsLessonTemplates(TestCase):
 class TestColorsLessonQuizFlow(TestCase):
     """Test complete quiz flow for colors lesson"""
 
-    def setUp(self):
-        """Create colors lesson and user"""
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create colors lesson and user once for the class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         call_command('create_colors_lesson')
-        self.lesson = Lesson.objects.get(title='Colors in Spanish')
-
-    def test_colors_quiz_submission_all_correct(self):
-        """Test submitting colors quiz with all correct answers"""
-        self.client.login(username='testuser', password='testpass123')
-
-        # Get all questions
-        questions = list(self.lesson.quiz_questions.all())
-
-        # Prepare all correct answers
-        answers = []
-        for q in questions:
-            answers.append({
-                'question_id': q.id,
-                'selected_index': q.correct_index
-            })
-
-        # Submit quiz
-        url = reverse('submit_lesson_quiz', args=[self.lesson.id])
-        response = self.client.post(
-            url,
-            json.dumps({'answers': answers}),
-            content_type='application/json'
-        )
-
-        # Verify response
-        self.assertEqual(response.status_code, 200)
-        json_response = response.json()
-        self.assertTrue(json_response['success'])
-        self.assertEqual(json_response['score'], 8)
-        self.assertEqual(json_response['total'], 8)
-
-        # Verify attempt was created
-        attempt = LessonAttempt.objects.get(lesson=self.lesson, user=self.user)
-        self.assertEqual(attempt.score, 8)
-        self.assertEqual(attempt.percentage, 100.0)
-
-    def test_colors_quiz_submission_mixed_answers(self):
-        """Test submitting colors quiz with mixed answers"""
-        self.client.login(username='testuser', password='testpass123')
-
-        # Get questions
-        questions = list(self.lesson.quiz_questions.all())
-
-        # Prepare mixed answers (first 4 correct, rest wrong)
-        answers = []
-        for i, q in enumerate(questions):
-            if i < 4:
-                selected = q.correct_index
-            else:
-                # Pick wrong answer
-                selected = (q.correct_index + 1) % len(q.options)
-            answers.append({
+        cls.lesson = Lesson.objects.get(title='Colors in Spanish')
+        cls.questions = list(cls.lesson.quiz_questions.all())
+        cls.all_correct_answers = [
+            {'question_id': q.id, 'selected_index': q.correct_index}
+            for q in cls.questions
+        ]
+
+    def test_colors_quiz_submissions(self):
+        """
+        Logged-in all-correct and mixed submissions, and a guest submission,
+        each score correctly and record their own attempt
+        """
+        # First 4 correct, rest wrong
+        mixed_answers = [
+            {
                 'question_id': q.id,
-                'selected_index': selected
-            })
-
-        # Submit quiz
+                'selected_index': q.correct_index if i < 4 else (q.correct_index + 1) % len(q.options)
+            }
+            for i, q in enumerate(self.questions)
+        ]
         url = reverse('submit_lesson_quiz', args=[self.lesson.id])
-        response = self.client.post(
-            url,
-            json.dumps({'answers': answers}),
-            content_type='application/json'
-        )
-
-        # Verify response
-        self.assertEqual(response.status_code, 200)
-        json_response = response.json()
-        self.assertEqual(json_response['score'], 4)
-        self.assertEqual(json_response['total'], 8)
-
-        # Verify attempt
-        attempt = LessonAttempt.objects.get(lesson=self.lesson, user=self.user)
-        self.assertEqual(attempt.score, 4)
-        self.assertEqual(attempt.percentage, 50.0)
-
-    def test_colors_quiz_guest_submission(self):
-        """Test guest user can submit colors quiz"""
-        # Don't log in - test as guest
-
-        # Get questions
-        questions = list(self.lesson.quiz_questions.all())
-
-        # Prepare answers
-        answers = []
-        for q in questions:
-            answers.append({
-                'question_id': q.id,
-                'selected_index': q.correct_index
-            })
 
-        # Submit quiz
-        url = reverse('submit_lesson_quiz', args=[self.lesson.id])
-        response = self.client.post(
-            url,
-            json.dumps({'answers': answers}),
-            content_type='application/json'
+        # (case, logged-in user or None for a guest, answers, score, percentage)
+        cases = (
+            ('all_correct', self.user, self.all_correct_answers, 8, 100.0),
+            ('mixed_answers', self.user, mixed_answers, 4, 50.0),
+            ('guest', None, self.all_correct_answers, 8, 100.0),
         )
-
-        # Verify response
-        self.assertEqual(response.status_code, 200)
-        json_response = response.json()
-        self.assertTrue(json_response['success'])
-
-        # Verify attempt was created with no user
-        attempt = LessonAttempt.objects.get(lesson=self.lesson)
-        self.assertIsNone(attempt.user)
-        self.assertEqual(attempt.score, 8)
+        for case, user, answers, score, percentage in cases:
+            with self.subTest(case=case):
+                client = Client()
+                if user is not None:
+                    client.force_login(user)
+
+                response = client.post(
+                    url,
+                    json.dumps({'answers': answers}),
+                    content_type='application/json'
+                )
+
+                # Verify response
+                self.assertEqual(response.status_code, 200)
+                json_response = response.json()
+                self.assertTrue(json_response['success'])
+                self.assertEqual(json_response['score'], score)
+                self.assertEqual(json_response['total'], 8)
+
+                # Verify attempt; cases share the test's transaction, so
+                # look it up by the id this submission returned
+                attempt = LessonAttempt.objects.get(id=json_response['attempt_id'], lesson=self.lesson)
+                self.assertEqual(attempt.user, user)
+                self.assertEqual(attempt.score, score)
+                self.assertEqual(attempt.percentage, percentage)
 
 
 class TestColorsLessonIntegration(TestCase):
     """Test colors lesson integration with shapes lesson"""
 
-    def setUp(self):
-        """Create both shapes and colors lessons"""
+    @classmethod
+    def setUpTestData(cls):
+        """Create both shapes and colors lessons once for the class"""
         call_command('create_shapes_lesson')
         call_command('create_colors_lesson')
-        self.shapes_lesson = Lesson.objects.get(title='Shapes in Spanish')
-        self.colors_lesson = Lesson.objects.get(title='Colors in Spanish')
+        cls.shapes_lesson = Lesson.objects.get(title='Shapes in Spanish')
+        cls.colors_lesson = Lesson.objects.get(title='Colors in Spanish')
 
     def test_lesson_progression_shapes_to_colors(self):
         """Test user can progress from shapes to colors lesson"""
@@ -286,7 +242,9 @@ class TestColorsLessonIntegration(TestCase):
         # Visit results page
         client = Client()
         url = reverse('lesson_results', args=[self.shapes_lesson.id, attempt.id])
-        response = client.get(url)
+        # Lesson + attempt + next_lesson
+        with self.assertNumQueries(3):
+            response = client.get(url)
 
         # Verify colors lesson is in context as next lesson
         self.assertEqual(response.context['next_lesson'], self.colors_lesson)
@@ -295,7 +253,9 @@ class TestColorsLessonIntegration(TestCase):
         """Test lessons list shows both shapes and colors in correct order"""
         client = Client()
         url = reverse('lessons_list')
-        response = client.get(url)
+        # One lessons query for a guest, however many lessons are listed
+        with self.assertNumQueries(1):
+            response = client.get(url)
 
         lessons = response.context['selected_language_lessons']
         lesson_objects = [entry['lesson'] for entry in lessons]
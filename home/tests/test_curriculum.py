@@ -12,7 +12,7 @@ Tests the new adaptive curriculum system models:
 from datetime import timedelta
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from home.models import (
@@ -23,38 +23,65 @@ from home.models import (
     UserQuestionAttempt,
     UserSkillMastery,
 )
+from home.tests.test_utils import seed_skill_categories
 
 
-class TestSkillCategory(TestCase):
-    """Test SkillCategory model."""
+# Core skills every SkillCategory deployment has (seeded by migration 0020)
+CORE_SKILLS = frozenset({'vocabulary', 'grammar', 'conversation', 'reading', 'listening'})
+# Vocabulary's icon, escaped so the check does not depend on source encoding
+BOOK_ICON = '\U0001F4DA'
 
-    def setUp(self):
-        """Set up test data."""
-        # Skill categories are seeded by migration
-        self.vocab = SkillCategory.objects.get(name='vocabulary')
-        self.grammar = SkillCategory.objects.get(name='grammar')
+
+class TestSkillCategory(SimpleTestCase):
+    """Test SkillCategory model behaviour that needs no database."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build an unsaved vocabulary category."""
+        super().setUpClass()
+        cls.vocab = SkillCategory(name='vocabulary', icon=BOOK_ICON, order=1)
 
     def test_skill_category_str(self):
         """Test string representation."""
         # SkillCategory includes emoji in __str__
-        self.assertIn('Vocabulary', str(self.vocab))
+        text = str(self.vocab)
+        self.assertIn('Vocabulary', text)
         # Check it starts with emoji
-        self.assertTrue(str(self.vocab).startswith('📚'))
+        self.assertTrue(text.startswith(BOOK_ICON))
 
     def test_skill_category_choices(self):
         """Test skill category has valid choices."""
-        valid_skills = ['vocabulary', 'grammar', 'conversation', 'reading', 'listening']
-        for skill_name in valid_skills:
-            skill = SkillCategory.objects.get(name=skill_name)
-            self.assertIn(skill.name, [choice[0] for choice in SkillCategory.SKILL_CHOICES])
+        self.assertLessEqual(CORE_SKILLS, {choice[0] for choice in SkillCategory.SKILL_CHOICES})
+
+
+class TestSkillCategorySeed(TestCase):
+    """Test the seeded SkillCategory rows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        seed_skill_categories()
+
+    def test_core_skills_seeded(self):
+        """Every core skill has a row, and vocabulary carries its book icon."""
+        # One query for all five seeded rows
+        icons = dict(
+            SkillCategory.objects.filter(name__in=CORE_SKILLS).values_list('name', 'icon')
+        )
+        self.assertEqual(set(icons), CORE_SKILLS)
+        self.assertEqual(icons['vocabulary'], BOOK_ICON)
 
 
 class TestLearningModule(TestCase):
     """Test LearningModule model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.module = LearningModule.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        seed_skill_categories()
+        cls.vocab = SkillCategory.objects.get(name='vocabulary')
+        cls.grammar = SkillCategory.objects.get(name='grammar')
+        cls.module = LearningModule.objects.create(
             language='Spanish',
             proficiency_level=1,
             name='Basics',
@@ -80,9 +107,8 @@ class TestLearningModule(TestCase):
 
     def test_get_lessons(self):
         """Test get_lessons returns lessons in skill order."""
-        # Create skill categories
-        vocab = SkillCategory.objects.get(name='vocabulary')
-        grammar = SkillCategory.objects.get(name='grammar')
+        vocab = self.vocab
+        grammar = self.grammar
 
         # Create lessons
         lesson1 = Lesson.objects.create(
@@ -102,8 +128,8 @@ class TestLearningModule(TestCase):
             is_published=True
         )
 
-        lessons = self.module.get_lessons()
-        self.assertEqual(lessons.count(), 2)
+        lessons = list(self.module.get_lessons())
+        self.assertEqual(len(lessons), 2)
         # Should be ordered by skill_category.order
         self.assertEqual(lessons[0].skill_category.order, vocab.order)
         self.assertEqual(lessons[1].skill_category.order, grammar.order)
@@ -112,21 +138,22 @@ class TestLearningModule(TestCase):
 class TestUserModuleProgress(TestCase):
     """Test UserModuleProgress model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.module = LearningModule.objects.create(
+        cls.module = LearningModule.objects.create(
             language='Spanish',
             proficiency_level=1,
             name='Basics'
         )
-        self.progress = UserModuleProgress.objects.create(
-            user=self.user,
-            module=self.module
+        cls.progress = UserModuleProgress.objects.create(
+            user=cls.user,
+            module=cls.module
         )
 
     def test_user_module_progress_str(self):
@@ -193,14 +220,16 @@ class TestUserModuleProgress(TestCase):
 class TestUserSkillMastery(TestCase):
     """Test UserSkillMastery model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.vocab = SkillCategory.objects.get(name='vocabulary')
+        seed_skill_categories()
+        cls.vocab = SkillCategory.objects.get(name='vocabulary')
 
     def test_user_skill_mastery_str(self):
         """Test string representation."""
@@ -237,25 +266,27 @@ class TestUserSkillMastery(TestCase):
 class TestUserQuestionAttempt(TestCase):
     """Test UserQuestionAttempt model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class."""
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.vocab = SkillCategory.objects.get(name='vocabulary')
-        self.lesson = Lesson.objects.create(
+        seed_skill_categories()
+        cls.vocab = SkillCategory.objects.get(name='vocabulary')
+        cls.lesson = Lesson.objects.create(
             title='Test Lesson',
             slug='test-lesson',
             language='Spanish',
             difficulty_level=1,
-            skill_category=self.vocab,
+            skill_category=cls.vocab,
             is_published=True
         )
         from home.models import LessonQuizQuestion
-        self.question = LessonQuizQuestion.objects.create(
-            lesson=self.lesson,
+        cls.question = LessonQuizQuestion.objects.create(
+            lesson=cls.lesson,
             question='Test question?',
             options=['A', 'B', 'C', 'D'],
             correct_index=0
@@ -23,9 +23,11 @@ from home.tests.test_helpers import (create_test_daily_quest,
 class DailyQuestServiceTests(TestCase):
     """Validate quest generation, scoring, and stats."""
 
-    def setUp(self):
-        self.user = create_test_user(password='pass1234')  # SOFA: DRY
-        self.lesson = Lesson.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user and quiz lesson once; each test gets its own copy."""
+        cls.user = create_test_user(password='pass1234')  # SOFA: DRY
+        cls.lesson = Lesson.objects.create(
             title='Colors in Spanish',
             language='Spanish',
             slug='colors-test',
@@ -34,14 +36,16 @@ class DailyQuestServiceTests(TestCase):
             is_published=True
         )
         options = ['Rojo', 'Azul', 'Verde', 'Amarillo']
-        for idx in range(1, 7):
-            LessonQuizQuestion.objects.create(
-                lesson=self.lesson,
+        LessonQuizQuestion.objects.bulk_create([
+            LessonQuizQuestion(
+                lesson=cls.lesson,
                 question=f'Color question {idx}',
                 options=options,
                 correct_index=idx % len(options),
                 order=idx
             )
+            for idx in range(1, 7)
+        ])
 
     def test_get_today_challenge_creates_quest_with_questions(self):
         """Service should create a quest with exactly 5 stored questions."""
@@ -61,13 +65,29 @@ class DailyQuestServiceTests(TestCase):
             for question in questions
         }
 
-        result = DailyQuestService.submit_challenge(self.user, post_data)
+        # 6 queries (quest, attempt select + insert, questions in one go,
+        # attempt update, profile XP update) plus 6 savepoint statements;
+        # a per-question query would change this count
+        with self.assertNumQueries(12):
+            result = DailyQuestService.submit_challenge(self.user, post_data)
 
         attempt = UserDailyQuestAttempt.objects.get(user=self.user, daily_quest=challenge['quest'])
         self.assertTrue(attempt.is_completed)
         self.assertEqual(attempt.correct_answers, DailyQuestService.QUESTIONS_PER_CHALLENGE)
         self.assertEqual(result['xp_awarded'], attempt.xp_earned)
 
+    def test_calculate_quest_score_uses_prefetched_questions(self):
+        """Scoring a quest with prefetched questions should not hit the database."""
+        challenge = DailyQuestService.get_today_challenge(self.user)
+        quest = DailyQuest.objects.prefetch_related('questions').get(pk=challenge['quest'].pk)
+        questions = list(quest.questions.all())
+        post_data = {f'question_{question.id}': question.correct_index for question in questions[:3]}
+
+        with self.assertNumQueries(0):
+            correct, total = DailyQuestService.calculate_quest_score(quest, post_data)
+
+        self.assertEqual((correct, total), (3, DailyQuestService.QUESTIONS_PER_CHALLENGE))
+
     def test_get_weekly_stats_only_counts_recent_attempts(self):
         """Weekly stats should include attempts completed within last 7 days."""
         quest = DailyQuest.objects.create(
@@ -115,7 +135,9 @@ class DailyQuestServiceTests(TestCase):
         )
         old_attempt.save(update_fields=['completed_at'])
 
-        stats = DailyQuestService.get_weekly_stats(self.user)
+        # Counts and sums come from one aggregate query, not loaded rows
+        with self.assertNumQueries(1):
+            stats = DailyQuestService.get_weekly_stats(self.user)
 
         self.assertEqual(stats['challenges_completed'], 1)
         self.assertEqual(stats['xp_earned'], attempt.xp_earned)
@@ -159,7 +181,8 @@ class DailyQuestServiceTests(TestCase):
             completed_at=timezone.now() - timedelta(days=30)
         )
 
-        stats = DailyQuestService.get_lifetime_stats(self.user)
+        with self.assertNumQueries(1):
+            stats = DailyQuestService.get_lifetime_stats(self.user)
 
         self.assertEqual(stats['challenges_completed'], 2)
         self.assertEqual(stats['xp_earned'], 80)
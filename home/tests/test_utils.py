@@ -2,14 +2,26 @@
 Shared test utilities and helpers.
 Used across all test modules for consistency.
 """
+import uuid
+from contextlib import contextmanager
+from importlib import import_module
+
+from django.apps import apps
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.db.models.signals import post_save
+from django.test import TestCase
+
+from home.models import create_user_profile, save_user_profile
 
 
 def create_test_user(**kwargs):
     """
     Factory method to create test users with secure, randomly generated data.
     
+    Usernames get a uuid4 suffix, so classes can build users in setUpTestData
+    without clashing (e.g. under ``manage.py test --parallel``). Tests must
+    read ``user.username`` rather than assume a fixed name.
+    
     Args:
         **kwargs: Optional user attributes to override defaults
     
@@ -18,7 +30,7 @@ def create_test_user(**kwargs):
     """
     from django.utils.crypto import get_random_string
     
-    random_suffix = get_random_string(8, allowed_chars='0123456789')
+    random_suffix = uuid.uuid4().hex[:8]
     
     defaults = {
         'username': f'testuser_{random_suffix}',
@@ -27,12 +39,10 @@ def create_test_user(**kwargs):
     }
     defaults.update(kwargs)
     
-    password = defaults.pop('password')
+    # create_user() hashes the password and saves once
     user = User.objects.create_user(**defaults)
-    user.set_password(password)
-    user.save()
     
-    user._test_password = password
+    user._test_password = defaults['password']
     return user
 
 
@@ -45,7 +55,7 @@ def create_test_superuser(**kwargs):
     """
     from django.utils.crypto import get_random_string
     
-    random_suffix = get_random_string(8, allowed_chars='0123456789')
+    random_suffix = uuid.uuid4().hex[:8]
     
     defaults = {
         'username': f'admin_{random_suffix}',
@@ -54,26 +64,71 @@ def create_test_superuser(**kwargs):
     }
     defaults.update(kwargs)
     
-    password = defaults.pop('password')
+    # create_superuser() hashes the password and saves once
     user = User.objects.create_superuser(**defaults)
-    user.set_password(password)
-    user.save()
     
-    user._test_password = password
+    user._test_password = defaults['password']
+    return user
+
+
+# Superuser shared by every admin test class in a module. Filled in by the
+# shared_admin_user pytest fixture (conftest.py); empty under manage.py test.
+SHARED_ADMIN = {}
+
+
+def get_shared_superuser():
+    """
+    Return the module-wide superuser, creating a per-class one as a fallback.
+
+    Under pytest, modules that request the shared_admin_user fixture get one
+    superuser for all their classes instead of one per setUpTestData. The
+    Django test runner has no such fixture, so a fresh superuser is created.
+    """
+    user = SHARED_ADMIN.get('user')
+    if user is None:
+        return create_test_superuser()
     return user
 
 
+@contextmanager
+def user_profile_signals_disabled():
+    """
+    Create users without the post_save handlers that build UserProfile rows.
+
+    Use for fixtures whose tests never read ``user.profile``; tests that do
+    need a profile should create it explicitly.
+    """
+    post_save.disconnect(create_user_profile, sender=User)
+    post_save.disconnect(save_user_profile, sender=User)
+    try:
+        yield
+    finally:
+        post_save.connect(create_user_profile, sender=User)
+        post_save.connect(save_user_profile, sender=User)
+
+
+def seed_skill_categories():
+    """
+    Ensure the five SkillCategory rows from migration 0020 exist.
+
+    Reuses the migration's own seed function (get_or_create, so a no-op when
+    migrations ran). Lets curriculum tests run with TEST_DISABLE_MIGRATIONS,
+    where data migrations are skipped.
+    """
+    migration = import_module('home.migrations.0020_seed_skill_categories')
+    migration.seed_skill_categories(apps, None)
+
+
 class AdminTestCase(TestCase):
     """Base class for admin-related tests with authenticated admin user."""
     
     @classmethod
     def setUpTestData(cls):
-        """Create reusable admin user"""
-        cls.admin_user = create_test_superuser()
+        """Create (or reuse the module-shared) admin user"""
+        cls.admin_user = get_shared_superuser()
     
     def setUp(self):
-        """Set up test client and login as admin"""
-        self.client = Client()
+        """Log the built-in test client in as admin"""
         self.client.login(
             username=self.admin_user.username,
             password=self.admin_user._test_password